@@ -1,18 +1,55 @@
 import os
 import re
 import math
+import time
+import heapq
+import bisect
 import random
 import asyncio
 import logging
+import functools
+from collections import OrderedDict
 from dataclasses import dataclass
+from operator import attrgetter
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List
+from urllib.parse import urlencode, quote
 
 import aiohttp
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson ускоряет парсинг ~2-3x, но не обязателен
+    import json
+    _json_loads = json.loads
+
 from aiogram import Bot, Dispatcher, Router
 from aiogram.filters import Command
 from aiogram.types import Message
 
+from templates import (
+    ANCHORS,
+    VOICE_TAGS,
+    OPENERS,
+    MORNING_TEMPLATES,
+    PHENOMENA,
+    DESCS,
+    DAY_TEMPLATES,
+    DAY_EVENTS,
+    ADVICES,
+    EVENING_TEMPLATES,
+    EVENINGS,
+    EVENING_DESCS,
+    METRIC_TEMPLATES,
+    RADAR_HEADERS,
+    RADAR_LINES,
+    CONF_TEMPLATES,
+    ASIDES,
+    MICRO_SECTIONS,
+    FINALS,
+)
+
 # -----------------------------
 # CONFIG
 # -----------------------------
@@ -35,15 +72,38 @@ PROTEST_QUERY = os.getenv(
 WINDOW_HOURS = 24
 MAX_ARTICLES = int(os.getenv("MAX_ARTICLES", "80"))
 
+# Константная часть запроса — собирается один раз при импорте.
+# Город подставляется как фраза в кавычках, чтобы пробелы/операторы
+# внутри названия не ломали парсер GDELT.
+_QUERY_PREFIX = f'({PROTEST_QUERY}) AND "'
+
+# Неизменные параметры GDELT, закодированные заранее
+_GDELT_STATIC_QS = urlencode(
+    {"mode": "ArtList", "format": "json", "sort": "DateDesc", "maxrecords": MAX_ARTICLES}
+)
+
+# GDELT обновляется раз в ~15 минут, так что повторные /forecast по тому же
+# городу можно отдавать из памяти без сети.
+CACHE_TTL = 600  # секунд
+CACHE_MAX_ENTRIES = 512
+
+# Раздельные бюджеты: медленный connect не съедает время на чтение тела,
+# и наоборот. С постоянной сессией connect обычно пропускается (keep-alive).
+GDELT_TIMEOUT = aiohttp.ClientTimeout(total=25, connect=5, sock_connect=5, sock_read=20)
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("protest-forecast-bot")
 router = Router()
 
+# Общая HTTP-сессия: создаётся в main(), чтобы не платить TCP+TLS handshake
+# на каждый /forecast. Keep-alive + DNS-кэш живут между запросами.
+SESSION: Optional[aiohttp.ClientSession] = None
+
 
 # -----------------------------
 # MODELS
 # -----------------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Article:
     title: str
     url: str
@@ -54,6 +114,10 @@ class Article:
 # -----------------------------
 # HELPERS
 # -----------------------------
+_WS_RE = re.compile(r"\s+")
+_FRAC_RE = re.compile(r"\.\d+$")
+
+
 def now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -67,32 +131,51 @@ def sigmoid(x: float) -> float:
 
 
 def human_city(s: str) -> str:
-    s = re.sub(r"\s+", " ", s.strip())
+    s = _WS_RE.sub(" ", s.strip())
     return s[:80]
 
 
+# Свой экземпляр Random: не ходим через module-level обёртки random.*
+_RNG = random.Random()
+
+
 def maybe(p: float) -> bool:
-    return random.random() < p
+    return _RNG.random() < p
 
 
 def pick(items: List[str]) -> str:
-    return random.choice(items)
+    return _RNG.choice(items)
 
 
-def _gdelt_start_datetime(hours_back: int) -> str:
+@functools.lru_cache(maxsize=8)
+def _gdelt_start_datetime_cached(hours_back: int, minute_bucket: int) -> str:
     dt = now_utc() - timedelta(hours=hours_back)
     return dt.strftime("%Y%m%d%H%M%S")
 
 
+def _gdelt_start_datetime(hours_back: int) -> str:
+    # В пределах минуты строка одна и та же — не пересчитываем strftime
+    return _gdelt_start_datetime_cached(hours_back, int(time.time()) // 60)
+
+
 def _parse_seendate(s: str) -> datetime:
     s = (s or "").replace("T", " ").replace("Z", "")
-    s = re.sub(r"\.\d+$", "", s).strip()
-    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y%m%d%H%M%S"):
+    s = _FRAC_RE.sub("", s).strip()
+    # GDELT отдаёт YYYYMMDDHHMMSS — разбираем напрямую, без strptime
+    digits = s.replace("-", "").replace(":", "").replace(" ", "")
+    if len(digits) == 14 and digits.isdigit():
         try:
-            return datetime.strptime(s, fmt).replace(tzinfo=timezone.utc)
-        except Exception:
+            return datetime(
+                int(digits[0:4]), int(digits[4:6]), int(digits[6:8]),
+                int(digits[8:10]), int(digits[10:12]), int(digits[12:14]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
             pass
-    return now_utc()
+    try:
+        return datetime.strptime(s, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+    except Exception:
+        return now_utc()
 
 
 async def _gdelt_get_json_tolerant(resp: aiohttp.ClientResponse) -> dict:
@@ -101,7 +184,7 @@ async def _gdelt_get_json_tolerant(resp: aiohttp.ClientResponse) -> dict:
     Мы игнорируем content-type и пытаемся распарсить, иначе возвращаем {}.
     """
     try:
-        return await resp.json(content_type=None)
+        return await resp.json(loads=_json_loads, content_type=None)
     except Exception:
         try:
             body = await resp.text()
@@ -116,61 +199,93 @@ async def _gdelt_get_json_tolerant(resp: aiohttp.ClientResponse) -> dict:
         return {}
 
 
-async def gdelt_fetch_articles(session: aiohttp.ClientSession, city: str) -> List[Article]:
+def build_query(city: str) -> str:
+    return _QUERY_PREFIX + city.replace('"', " ").strip() + '"'
+
+
+# запрос -> (monotonic ts, articles, source countries)
+_GDELT_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+
+# GDELT режет слишком параллельных клиентов; кэш-хиты семафор не проходят.
+# Лимит совпадает с limit_per_host коннектора, чтобы не ждать в двух очередях.
+_GDELT_SEM = asyncio.Semaphore(8)
+
+
+async def gdelt_fetch_articles(session: aiohttp.ClientSession, query: str) -> tuple:
+    cache_key = query.lower()
+    cached = _GDELT_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < CACHE_TTL:
+        _GDELT_CACHE.move_to_end(cache_key)
+        return cached[1], cached[2]
+
     startdt = _gdelt_start_datetime(WINDOW_HOURS)
-    query = f"({PROTEST_QUERY}) AND ({city})"
-
-    params = {
-        "query": query,
-        "mode": "ArtList",
-        "format": "json",
-        "sort": "DateDesc",
-        "maxrecords": str(MAX_ARTICLES),
-        "startdatetime": startdt,
-    }
 
-    async with session.get(
-        GDELT_DOC_BASE,
-        params=params,
-        headers={"User-Agent": USER_AGENT},
-        timeout=25
-    ) as resp:
-        if resp.status != 200:
-            txt = await resp.text()
-            logger.warning("GDELT HTTP %s: %s", resp.status, txt[:200].replace("\n", " "))
-            return []
-        data = await _gdelt_get_json_tolerant(resp)
-
-    arts: List[Article] = []
-    for item in (data.get("articles") or []):
-        title = item.get("title") or ""
-        url = item.get("url") or ""
-        seendate = _parse_seendate(item.get("seendate", ""))
-        source_country = item.get("sourceCountry")
-        if title and url:
-            arts.append(Article(title=title, url=url, seendate=seendate, source_country=source_country))
-    return arts
+    # Собираем query string сами — aiohttp не тратится на URL.with_query;
+    # кодируем только изменяемые параметры, остальное уже готово
+    qs = (
+        urlencode({"query": query, "startdatetime": startdt}, quote_via=quote)
+        + "&"
+        + _GDELT_STATIC_QS
+    )
+
+    async with _GDELT_SEM:
+        async with session.get(
+            f"{GDELT_DOC_BASE}?{qs}",
+            timeout=GDELT_TIMEOUT
+        ) as resp:
+            if resp.status != 200:
+                txt = await resp.text()
+                logger.warning("GDELT HTTP %s: %s", resp.status, txt[:200].replace("\n", " "))
+                return [], set()
+            data = await _gdelt_get_json_tolerant(resp)
+
+    arts: List[Article] = [
+        Article(
+            title=title,
+            url=url,
+            seendate=_parse_seendate(item.get("seendate", "")),
+            source_country=item.get("sourceCountry"),
+        )
+        for item in (data.get("articles") or [])
+        if (title := item.get("title")) and (url := item.get("url"))
+    ]
+
+    countries = {a.source_country for a in arts if a.source_country}
+
+    _GDELT_CACHE[cache_key] = (time.monotonic(), arts, countries)
+    _GDELT_CACHE.move_to_end(cache_key)
+    while len(_GDELT_CACHE) > CACHE_MAX_ENTRIES:
+        _GDELT_CACHE.popitem(last=False)
+    return arts, countries
 
 
 # -----------------------------
 # METRICS (24h only)
 # -----------------------------
-def compute_metrics(articles_24h: List[Article]) -> dict:
+# Входы метрик — целые счётчики, так что кривые можно затабулировать
+# один раз вместо math.exp на каждый запрос.
+_PRECIP_TABLE = tuple(clamp(1.0 - math.exp(-i / 6.0), 0.0, 1.0) for i in range(256))
+_WIND_TABLE = tuple(clamp(sigmoid((i - 4.0) * 0.7), 0.0, 1.0) for i in range(256))
+_PRESS_TABLE = tuple(clamp(1.0 - math.exp(-i / 4.0), 0.0, 1.0) for i in range(64))
+_CONF_TABLE = tuple(clamp(1.0 - math.exp(-i / 5.5), 0.0, 1.0) for i in range(256))
+
+
+def compute_metrics(articles_24h: List[Article], countries: set) -> dict:
     """
     Всё только по 24 часам:
     - n: сколько материалов найдено в новостной базе по запросу (город + ключевые слова)
+    - countries: страны источников, уже собранные при загрузке
     """
     n = len(articles_24h)
 
-    precipitation = clamp(1.0 - math.exp(-n / 6.0), 0.0, 1.0)
-    wind = clamp(sigmoid((n - 4.0) * 0.7), 0.0, 1.0)
+    precipitation = _PRECIP_TABLE[min(n, 255)]
+    wind = _WIND_TABLE[min(n, 255)]
 
-    countries = [a.source_country for a in articles_24h if a.source_country]
-    diversity = len(set(countries))
-    pressure = clamp(1.0 - math.exp(-diversity / 4.0), 0.0, 1.0)
+    diversity = len(countries)
+    pressure = _PRESS_TABLE[min(diversity, 63)]
 
     temperature = clamp(0.55 * precipitation + 0.30 * wind + 0.15 * pressure, 0.0, 1.0)
-    confidence = clamp(1.0 - math.exp(-n / 5.5), 0.0, 1.0)
+    confidence = _CONF_TABLE[min(n, 255)]
 
     return {
         "n": float(n),
@@ -182,228 +297,45 @@ def compute_metrics(articles_24h: List[Article]) -> dict:
     }
 
 
-def lvl3(x: float, a: float, b: float, low: str, mid: str, high: str) -> str:
-    if x < a:
-        return low
-    if x < b:
-        return mid
-    return high
+# (пороги, подписи) для каждой метрики; выбор — через bisect по порогам
+_PRECIP_SCALE = ((0.25, 0.65), ("низкая", "умеренная", "высокая"))
+_WIND_SCALE = ((0.25, 0.65), ("слабый", "заметный", "порывистый"))
+_PRESS_SCALE = ((0.25, 0.65), ("спокойное", "переменное", "нестабильное"))
+_TEMP_SCALE = ((0.30, 0.75), ("прохладная", "тёплая", "горячая"))
+_CONF_SCALE = ((0.35, 0.75), ("низкая", "средняя", "высокая"))
+
+
+def lvl3(x: float, scale: tuple) -> str:
+    bins, labels = scale
+    return labels[bisect.bisect(bins, x)]
 
 
 def words(metrics: dict) -> dict:
-    precip = lvl3(metrics["precipitation"], 0.25, 0.65, "низкая", "умеренная", "высокая")
-    wind = lvl3(metrics["wind"], 0.25, 0.65, "слабый", "заметный", "порывистый")
-    press = lvl3(metrics["pressure"], 0.25, 0.65, "спокойное", "переменное", "нестабильное")
+    precip = lvl3(metrics["precipitation"], _PRECIP_SCALE)
+    wind = lvl3(metrics["wind"], _WIND_SCALE)
+    press = lvl3(metrics["pressure"], _PRESS_SCALE)
 
     t = metrics["temperature"]
-    temp = lvl3(t, 0.30, 0.75, "прохладная", "тёплая", "горячая")
+    temp = lvl3(t, _TEMP_SCALE)
     if t > 0.88:
         temp = "перегретая"
 
-    conf = lvl3(metrics["confidence"], 0.35, 0.75, "низкая", "средняя", "высокая")
+    conf = lvl3(metrics["confidence"], _CONF_SCALE)
     return {"precip": precip, "wind": wind, "press": press, "temp": temp, "conf": conf}
 
 
 # -----------------------------
-# TEXT ENGINE (HUGE VARIETY)
+# TEXT ENGINE (HUGE VARIETY) — блоки текста живут в templates.py
 # -----------------------------
-ANCHORS = [
-    "☁️ Прогноз общественной погоды",
-    "🌦 Политико-метеосводка",
-    "⛅ Прогноз по атмосферным обсуждениям",
-    "🌤 Городская погодная сводка по повестке",
-    "🌥 Прогноз настроений и заголовков",
-    "🛰 Сводка с радара ленты",
-    "📡 Облачный бюллетень новостей",
-    "🌧 Сводка по осадкам смысла",
-    "🌪 Синоптическая карта дискуссий",
-    "🌈 Прогноз: шанс на свет среди облаков",
-    "🗞 Погодная сводка редакции «Не кипятись»",
-    "🧭 Навигация по ветрам повестки",
-    "🌫 Метеорология общественных разговоров",
-    "🧠 Прогноз для критического мышления",
-    "📻 Радиосводка «Погода: Слова»",
-    "🕯️ Прогноз с примесью свечного света",
-]
-
-VOICE_TAGS = [
-    "Говорит метеостанция здравого смысла.",
-    "На связи синоптики реальности.",
-    "Передаём с фронта заголовков.",
-    "Доклад с балкона критического мышления.",
-    "Сводка с метеорадара комментариев.",
-    "Служба наблюдения за повесткой сообщает.",
-    "Официально-неофициальная метеослужба: внимание.",
-    "Отдел прогнозов: «Сначала факты».",
-    "Дежурный синоптик эмоций докладывает.",
-    "Прямое включение из циклона интерпретаций.",
-    "Штаб по борьбе с перегревом сообщает.",
-    "Лаборатория «Громкость ≠ Истина» на линии.",
-    "У микрофона редакция «Проверяй первоисточник».",
-    "Сводка по климату ленты: коротко и без паники.",
-    "Радио «Тихий разум»: выпуск срочный, но спокойный.",
-]
-
-OPENERS = [
-    "За последние 24 часа воздух заметно наэлектризовался словами.",
-    "За сутки в атмосфере накопилось достаточно шума, чтобы он начал казаться погодой.",
-    "Последние 24 часа: лента ведёт себя как климат, но это всё ещё эмоции.",
-    "Сутки были насыщены упоминаниями — местами с эффектом грома без дождя.",
-    "Суточный прогноз: вероятность оценивается по публичным сигналам.",
-    "Погода сегодня из тех, что начинается в телефоне и заканчивается в голове.",
-    "Если кажется, что всё «вот-вот» — возможно, это просто давление заголовков.",
-    "В течение суток замечены облака интерпретаций и туман обобщений.",
-    "Сводка за сутки: много слов, мало воздуха. Дышим.",
-    "Отмечены локальные завихрения в повестке. Панике вход воспрещён.",
-]
-
-MORNING_TEMPLATES = [
-    "Утром вероятны {phenomenon} — явление {desc}.",
-    "С утра возможны {phenomenon}: {desc}.",
-    "Первая половина дня обещает {phenomenon}. По ощущениям — {desc}.",
-    "На утреннем горизонте: {phenomenon}. Характер: {desc}.",
-    "Утро приносит {phenomenon}, и это {desc}.",
-    "Утренний фронт: {phenomenon}. Сопровождение — {desc}.",
-    "В утренние часы вероятны {phenomenon}. Сценарий: {desc}.",
-]
-
-PHENOMENA = [
-    "локальные выступления и митинговая повестка",
-    "точечные всплески уличной активности",
-    "волны солидарности и встречные течения",
-    "скопления людей вокруг громких тем",
-    "порывы плакатов и лозунгов (местами)",
-    "облачность из призывов и контрпризывов",
-    "локальные сгущения вокруг символов и лозунгов",
-    "карманы напряжённости на карте обсуждений",
-]
-
-DESCS = [
-    "шумное, но обычно кратковременное",
-    "визуально плотное, но часто переменное",
-    "эмоционально громкое, но не всегда длительное",
-    "с оттенком «сейчас-сейчас» и быстрым рассеиванием",
-    "похожее на грозу: много звука, мало осадков",
-    "то сгущается, то исчезает — как будто само сомневается",
-    "сильнее на экране, чем на улице — но всё равно заметное",
-]
-
-DAY_TEMPLATES = [
-    "Днём ожидаются {day_event}; рекомендуется {advice}.",
-    "После обеда возможны {day_event}. На всякий случай — {advice}.",
-    "Во второй половине дня — {day_event}. Лучше держать рядом: {advice}.",
-    "К середине дня поднимаются {day_event}. Практика дня: {advice}.",
-    "Дневной фон: {day_event}. Совет: {advice}.",
-    "Днём — {day_event}. Метеозащита: {advice}.",
-]
-
-DAY_EVENTS = [
-    "порывы «breaking news»",
-    "облака срочных интерпретаций",
-    "резкие смены ветра в заголовках",
-    "вспышки спорных тезисов",
-    "ливни из «экспертных» выводов",
-    "перепады тона в комментариях",
-    "переохлаждение фактов и перегрев мнений",
-    "циклон «все знают как надо»",
-    "туман «контекст не нужен»",
-    "град «очевидных» выводов без доказательств",
-]
-
-ADVICES = [
-    "зонт критического мышления",
-    "куртку здравого смысла",
-    "паузу между «увидел» и «поверил»",
-    "проверку источников перед репостом",
-    "ограничитель новостного скролла",
-    "тёплый чай и холодную голову",
-    "правило двух вкладок: факт + первоисточник",
-    "режим «не спорю на голодный мозг»",
-]
-
-EVENING_TEMPLATES = [
-    "К вечеру возможен {evening}: {evening_desc}.",
-    "Ближе к вечеру — {evening}. Итог: {evening_desc}.",
-    "Вечером приходит {evening} — и {evening_desc}.",
-    "К ночи вероятен {evening}. Обычно это когда {evening_desc}.",
-    "Финал дня: {evening}. Это значит — {evening_desc}.",
-]
-
-EVENINGS = [
-    "шаббат-бриз",
-    "затишье вне ленты",
-    "режим «отложенные новости»",
-    "возврат к человеческому масштабу",
-    "тихая пауза в споре",
-    "вечерняя тишина без срочности",
-    "переключение с «кто прав» на «как ты?»",
-]
-
-EVENING_DESCS = [
-    "шум стихает, а смысл становится слышнее",
-    "темп падает, и хочется говорить тише",
-    "появляется шанс на нормальные слова",
-    "вдруг оказывается, что люди важнее дискуссий",
-    "заголовки откладываются, а жизнь остаётся",
-    "можно зажечь свет — и не доказывать его необходимость",
-]
-
-METRIC_TEMPLATES = [
-    "🌡 Температура общественного мнения — **{temp}**.\n🌬 Ветер заголовков — **{wind}**.\n🌍 Международное давление — **{press}**.",
-    "🌡 Температура: **{temp}** | 🌬 Ветер: **{wind}** | 🌍 Давление: **{press}**.",
-    "🌡 По ощущениям: **{temp}**.\n🌬 Порывы: **{wind}**.\n🌍 Давление: **{press}**.",
-    "🌡 Термометр эмоций: **{temp}**.\n🌬 Анемометр заголовков: **{wind}**.\n🌍 Барометр внешнего давления: **{press}**.",
-]
-
-RADAR_HEADERS = [
-    "📡 Радар за 24 часа",
-    "🛰 Радар суток",
-    "📍 Суточные сигналы",
-    "🗞 Индекс ленты за сутки",
-    "📊 Статистика за 24 часа",
-    "🔔 Детектор упоминаний",
-]
-
-RADAR_LINES = [
-    "Найдено материалов по запросу (город + ключевые слова): **{n}**.",
-    "Публичных новостных сигналов за 24 часа: **{n}**.",
-    "Количество совпадений в новостной базе за сутки: **{n}**.",
-    "Индекс сигналов за сутки: **{n}** (это число найденных материалов).",
-]
-
-CONF_TEMPLATES = [
-    "🔎 Уверенность прогноза: **{conf}** (больше сигналов → выше уверенность).",
-    "🔎 Надёжность оценки: **{conf}**.",
-    "🔎 Доверие к прогнозу: **{conf}**.",
-    "🔎 Качество сигнала: **{conf}**.",
-]
-
-ASIDES = [
-    "🧲 Магнитных бурь не ожидается, но внутренние — возможны.",
-    "🪟 Рекомендуется проветрить ленту и закрыть вкладки со слухами.",
-    "🧊 Осторожно: лёд в комментариях. Держитесь ближе к фактам.",
-    "🧯 При перегреве — выключить спор и включить дыхание.",
-    "🧠 Побочный эффект новостей: уверенность без доказательств.",
-    "🧾 Если кто-то кричит «всё очевидно» — проверьте, что именно.",
-    "🧘 Минимум: не спорить в моменте. Максимум: быть человеком.",
-]
-
-MICRO_SECTIONS = [
-    "🧩 Иногда заголовок — это облако без дождя. Не выдавайте его за климат.",
-    "🧷 Короткое правило: один факт — два источника.",
-    "🧠 Напоминание: громкость — не аргумент.",
-    "🧭 Хороший компас: «что я могу проверить?»",
-    "🕯️ Если день тяжёлый — уменьши скорость. Это управление, не слабость.",
-]
-
-FINALS = [
-    "Береги себя: даже пасмурная повестка не отменяет свет.",
-    "Помни: свет не требует разрешения у заголовков.",
-    "Береги голову и сердце: в любую погоду можно оставаться человеком.",
-    "Даже если небо спорит — свеча всё равно горит.",
-    "Если стало шумно — сделай тише внутри. Это тоже навык.",
-    "Не отменяй свет из-за прогноза. Добавь его сам.",
-]
+_EMPTY_MESSAGE = (
+    "☁️ Прогноз общественной погоды: %(city)s\n\n"
+    "📡 Радар за 24 часа\n"
+    "Найдено материалов по запросу (город + ключевые слова): **0**.\n"
+    "⚠️ Это не значит «событий не будет». "
+    "Это значит: за 24 часа в новостной базе не найдено совпадений по запросу "
+    "(город + ключевые слова).\n\n"
+    "Береги себя: даже пасмурная повестка не отменяет свет."
+)
 
 
 def build_message(city: str, metrics: dict, top_articles: List[Article]) -> str:
@@ -411,33 +343,29 @@ def build_message(city: str, metrics: dict, top_articles: List[Article]) -> str:
     Устойчивая функция генерации: без сложных ветвлений, чтобы не ловить return/indent ошибки.
     При этом текст разнообразный (много вариантов блоков + случайные вставки).
     """
+    # Частый случай (мелкие города, сбои GDELT): сигналов нет — отдаём
+    # готовую заглушку и не крутим генератор вообще.
+    if int(metrics["n"]) == 0:
+        return _EMPTY_MESSAGE % {"city": city}
+
     w = words(metrics)
 
     title = f"{pick(ANCHORS)}: {city}"
     voice = pick(VOICE_TAGS)
     opener = pick(OPENERS)
 
-    morning = pick(MORNING_TEMPLATES).format(phenomenon=pick(PHENOMENA), desc=pick(DESCS))
-    day = pick(DAY_TEMPLATES).format(day_event=pick(DAY_EVENTS), advice=pick(ADVICES))
-    evening = pick(EVENING_TEMPLATES).format(evening=pick(EVENINGS), evening_desc=pick(EVENING_DESCS))
+    morning = pick(MORNING_TEMPLATES) % {"phenomenon": pick(PHENOMENA), "desc": pick(DESCS)}
+    day = pick(DAY_TEMPLATES) % {"day_event": pick(DAY_EVENTS), "advice": pick(ADVICES)}
+    evening = pick(EVENING_TEMPLATES) % {"evening": pick(EVENINGS), "evening_desc": pick(EVENING_DESCS)}
 
-    metrics_block = pick(METRIC_TEMPLATES).format(temp=w["temp"], wind=w["wind"], press=w["press"])
-
-    note = ""
-    if int(metrics["n"]) == 0:
-        note = (
-            "\n⚠️ Это не значит «событий не будет». "
-            "Это значит: за 24 часа в новостной базе не найдено совпадений по запросу "
-            "(город + ключевые слова)."
-        )
+    metrics_block = pick(METRIC_TEMPLATES) % {"temp": w["temp"], "wind": w["wind"], "press": w["press"]}
 
     radar_block = (
         f"{pick(RADAR_HEADERS)}\n"
-        + pick(RADAR_LINES).format(n=int(metrics["n"]))
-        + note
+        + pick(RADAR_LINES) % {"n": int(metrics["n"])}
     )
 
-    conf_block = pick(CONF_TEMPLATES).format(conf=w["conf"])
+    conf_block = pick(CONF_TEMPLATES) % {"conf": w["conf"]}
     final = pick(FINALS)
 
     sections: List[str] = []
@@ -449,7 +377,7 @@ def build_message(city: str, metrics: dict, top_articles: List[Article]) -> str:
     # Иногда меняем порядок середины
     trio = [morning, day, evening]
     if maybe(0.25):
-        random.shuffle(trio)
+        _RNG.shuffle(trio)
     if maybe(0.75):
         trio = [x for x in trio if x != evening] + [evening]
     sections.extend(trio)
@@ -458,7 +386,7 @@ def build_message(city: str, metrics: dict, top_articles: List[Article]) -> str:
     tail = [metrics_block, radar_block]
     if maybe(0.80):
         tail.append(conf_block)
-    random.shuffle(tail)
+    _RNG.shuffle(tail)
     sections.extend(tail)
 
     # Вставки
@@ -471,10 +399,8 @@ def build_message(city: str, metrics: dict, top_articles: List[Article]) -> str:
 
     # Источники иногда показываем
     if top_articles and maybe(0.72):
-        lines = []
-        for a in top_articles[:7]:
-            lines.append(f"• {a.title}\n  {a.url}")
-        sections.append("📰 Открытые сигналы (24ч):\n" + "\n".join(lines))
+        links = "\n".join(f"• {a.title}\n  {a.url}" for a in top_articles)
+        sections.append("📰 Открытые сигналы (24ч):\n" + links)
 
     text = "\n\n".join(sections).strip()
     return text
@@ -503,15 +429,14 @@ async def cmd_forecast(message: Message):
 
     city = human_city(parts[1])
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            articles_24h = await gdelt_fetch_articles(session, city=city)
-        except Exception as e:
-            logger.warning("GDELT fetch failed: %r", e)
-            articles_24h = []
+    try:
+        articles_24h, countries = await gdelt_fetch_articles(SESSION, build_query(city))
+    except Exception as e:
+        logger.warning("GDELT fetch failed: %r", e)
+        articles_24h, countries = [], set()
 
-    metrics = compute_metrics(articles_24h)
-    top_articles = sorted(articles_24h, key=lambda a: a.seendate, reverse=True)
+    metrics = compute_metrics(articles_24h, countries)
+    top_articles = heapq.nlargest(7, articles_24h, key=attrgetter("seendate"))
 
     await message.answer(build_message(city, metrics, top_articles), disable_web_page_preview=True)
 
@@ -520,11 +445,25 @@ async def cmd_forecast(message: Message):
 # MAIN
 # -----------------------------
 async def main():
+    global SESSION
     bot = Bot(BOT_TOKEN)
     dp = Dispatcher()
     dp.include_router(router)
+
+    SESSION = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        ),
+        headers={"User-Agent": USER_AGENT},
+    )
     logger.info("Bot started (polling)")
-    await dp.start_polling(bot)
+    try:
+        await dp.start_polling(bot)
+    finally:
+        await SESSION.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,202 @@
+"""
+Константные блоки текста для генератора сводок.
+Кортежи: наборы не меняются в рантайме, random.choice работает с ними так же.
+"""
+
+ANCHORS = (
+    "☁️ Прогноз общественной погоды",
+    "🌦 Политико-метеосводка",
+    "⛅ Прогноз по атмосферным обсуждениям",
+    "🌤 Городская погодная сводка по повестке",
+    "🌥 Прогноз настроений и заголовков",
+    "🛰 Сводка с радара ленты",
+    "📡 Облачный бюллетень новостей",
+    "🌧 Сводка по осадкам смысла",
+    "🌪 Синоптическая карта дискуссий",
+    "🌈 Прогноз: шанс на свет среди облаков",
+    "🗞 Погодная сводка редакции «Не кипятись»",
+    "🧭 Навигация по ветрам повестки",
+    "🌫 Метеорология общественных разговоров",
+    "🧠 Прогноз для критического мышления",
+    "📻 Радиосводка «Погода: Слова»",
+    "🕯️ Прогноз с примесью свечного света",
+)
+
+VOICE_TAGS = (
+    "Говорит метеостанция здравого смысла.",
+    "На связи синоптики реальности.",
+    "Передаём с фронта заголовков.",
+    "Доклад с балкона критического мышления.",
+    "Сводка с метеорадара комментариев.",
+    "Служба наблюдения за повесткой сообщает.",
+    "Официально-неофициальная метеослужба: внимание.",
+    "Отдел прогнозов: «Сначала факты».",
+    "Дежурный синоптик эмоций докладывает.",
+    "Прямое включение из циклона интерпретаций.",
+    "Штаб по борьбе с перегревом сообщает.",
+    "Лаборатория «Громкость ≠ Истина» на линии.",
+    "У микрофона редакция «Проверяй первоисточник».",
+    "Сводка по климату ленты: коротко и без паники.",
+    "Радио «Тихий разум»: выпуск срочный, но спокойный.",
+)
+
+OPENERS = (
+    "За последние 24 часа воздух заметно наэлектризовался словами.",
+    "За сутки в атмосфере накопилось достаточно шума, чтобы он начал казаться погодой.",
+    "Последние 24 часа: лента ведёт себя как климат, но это всё ещё эмоции.",
+    "Сутки были насыщены упоминаниями — местами с эффектом грома без дождя.",
+    "Суточный прогноз: вероятность оценивается по публичным сигналам.",
+    "Погода сегодня из тех, что начинается в телефоне и заканчивается в голове.",
+    "Если кажется, что всё «вот-вот» — возможно, это просто давление заголовков.",
+    "В течение суток замечены облака интерпретаций и туман обобщений.",
+    "Сводка за сутки: много слов, мало воздуха. Дышим.",
+    "Отмечены локальные завихрения в повестке. Панике вход воспрещён.",
+)
+
+MORNING_TEMPLATES = (
+    "Утром вероятны %(phenomenon)s — явление %(desc)s.",
+    "С утра возможны %(phenomenon)s: %(desc)s.",
+    "Первая половина дня обещает %(phenomenon)s. По ощущениям — %(desc)s.",
+    "На утреннем горизонте: %(phenomenon)s. Характер: %(desc)s.",
+    "Утро приносит %(phenomenon)s, и это %(desc)s.",
+    "Утренний фронт: %(phenomenon)s. Сопровождение — %(desc)s.",
+    "В утренние часы вероятны %(phenomenon)s. Сценарий: %(desc)s.",
+)
+
+PHENOMENA = (
+    "локальные выступления и митинговая повестка",
+    "точечные всплески уличной активности",
+    "волны солидарности и встречные течения",
+    "скопления людей вокруг громких тем",
+    "порывы плакатов и лозунгов (местами)",
+    "облачность из призывов и контрпризывов",
+    "локальные сгущения вокруг символов и лозунгов",
+    "карманы напряжённости на карте обсуждений",
+)
+
+DESCS = (
+    "шумное, но обычно кратковременное",
+    "визуально плотное, но часто переменное",
+    "эмоционально громкое, но не всегда длительное",
+    "с оттенком «сейчас-сейчас» и быстрым рассеиванием",
+    "похожее на грозу: много звука, мало осадков",
+    "то сгущается, то исчезает — как будто само сомневается",
+    "сильнее на экране, чем на улице — но всё равно заметное",
+)
+
+DAY_TEMPLATES = (
+    "Днём ожидаются %(day_event)s; рекомендуется %(advice)s.",
+    "После обеда возможны %(day_event)s. На всякий случай — %(advice)s.",
+    "Во второй половине дня — %(day_event)s. Лучше держать рядом: %(advice)s.",
+    "К середине дня поднимаются %(day_event)s. Практика дня: %(advice)s.",
+    "Дневной фон: %(day_event)s. Совет: %(advice)s.",
+    "Днём — %(day_event)s. Метеозащита: %(advice)s.",
+)
+
+DAY_EVENTS = (
+    "порывы «breaking news»",
+    "облака срочных интерпретаций",
+    "резкие смены ветра в заголовках",
+    "вспышки спорных тезисов",
+    "ливни из «экспертных» выводов",
+    "перепады тона в комментариях",
+    "переохлаждение фактов и перегрев мнений",
+    "циклон «все знают как надо»",
+    "туман «контекст не нужен»",
+    "град «очевидных» выводов без доказательств",
+)
+
+ADVICES = (
+    "зонт критического мышления",
+    "куртку здравого смысла",
+    "паузу между «увидел» и «поверил»",
+    "проверку источников перед репостом",
+    "ограничитель новостного скролла",
+    "тёплый чай и холодную голову",
+    "правило двух вкладок: факт + первоисточник",
+    "режим «не спорю на голодный мозг»",
+)
+
+EVENING_TEMPLATES = (
+    "К вечеру возможен %(evening)s: %(evening_desc)s.",
+    "Ближе к вечеру — %(evening)s. Итог: %(evening_desc)s.",
+    "Вечером приходит %(evening)s — и %(evening_desc)s.",
+    "К ночи вероятен %(evening)s. Обычно это когда %(evening_desc)s.",
+    "Финал дня: %(evening)s. Это значит — %(evening_desc)s.",
+)
+
+EVENINGS = (
+    "шаббат-бриз",
+    "затишье вне ленты",
+    "режим «отложенные новости»",
+    "возврат к человеческому масштабу",
+    "тихая пауза в споре",
+    "вечерняя тишина без срочности",
+    "переключение с «кто прав» на «как ты?»",
+)
+
+EVENING_DESCS = (
+    "шум стихает, а смысл становится слышнее",
+    "темп падает, и хочется говорить тише",
+    "появляется шанс на нормальные слова",
+    "вдруг оказывается, что люди важнее дискуссий",
+    "заголовки откладываются, а жизнь остаётся",
+    "можно зажечь свет — и не доказывать его необходимость",
+)
+
+METRIC_TEMPLATES = (
+    "🌡 Температура общественного мнения — **%(temp)s**.\n🌬 Ветер заголовков — **%(wind)s**.\n🌍 Международное давление — **%(press)s**.",
+    "🌡 Температура: **%(temp)s** | 🌬 Ветер: **%(wind)s** | 🌍 Давление: **%(press)s**.",
+    "🌡 По ощущениям: **%(temp)s**.\n🌬 Порывы: **%(wind)s**.\n🌍 Давление: **%(press)s**.",
+    "🌡 Термометр эмоций: **%(temp)s**.\n🌬 Анемометр заголовков: **%(wind)s**.\n🌍 Барометр внешнего давления: **%(press)s**.",
+)
+
+RADAR_HEADERS = (
+    "📡 Радар за 24 часа",
+    "🛰 Радар суток",
+    "📍 Суточные сигналы",
+    "🗞 Индекс ленты за сутки",
+    "📊 Статистика за 24 часа",
+    "🔔 Детектор упоминаний",
+)
+
+RADAR_LINES = (
+    "Найдено материалов по запросу (город + ключевые слова): **%(n)s**.",
+    "Публичных новостных сигналов за 24 часа: **%(n)s**.",
+    "Количество совпадений в новостной базе за сутки: **%(n)s**.",
+    "Индекс сигналов за сутки: **%(n)s** (это число найденных материалов).",
+)
+
+CONF_TEMPLATES = (
+    "🔎 Уверенность прогноза: **%(conf)s** (больше сигналов → выше уверенность).",
+    "🔎 Надёжность оценки: **%(conf)s**.",
+    "🔎 Доверие к прогнозу: **%(conf)s**.",
+    "🔎 Качество сигнала: **%(conf)s**.",
+)
+
+ASIDES = (
+    "🧲 Магнитных бурь не ожидается, но внутренние — возможны.",
+    "🪟 Рекомендуется проветрить ленту и закрыть вкладки со слухами.",
+    "🧊 Осторожно: лёд в комментариях. Держитесь ближе к фактам.",
+    "🧯 При перегреве — выключить спор и включить дыхание.",
+    "🧠 Побочный эффект новостей: уверенность без доказательств.",
+    "🧾 Если кто-то кричит «всё очевидно» — проверьте, что именно.",
+    "🧘 Минимум: не спорить в моменте. Максимум: быть человеком.",
+)
+
+MICRO_SECTIONS = (
+    "🧩 Иногда заголовок — это облако без дождя. Не выдавайте его за климат.",
+    "🧷 Короткое правило: один факт — два источника.",
+    "🧠 Напоминание: громкость — не аргумент.",
+    "🧭 Хороший компас: «что я могу проверить?»",
+    "🕯️ Если день тяжёлый — уменьши скорость. Это управление, не слабость.",
+)
+
+FINALS = (
+    "Береги себя: даже пасмурная повестка не отменяет свет.",
+    "Помни: свет не требует разрешения у заголовков.",
+    "Береги голову и сердце: в любую погоду можно оставаться человеком.",
+    "Даже если небо спорит — свеча всё равно горит.",
+    "Если стало шумно — сделай тише внутри. Это тоже навык.",
+    "Не отменяй свет из-за прогноза. Добавь его сам.",
+)